@@ -14,8 +14,91 @@ Author: Adapted from experimental code
 Date: 2025
 """
 
-from decimal import Decimal, getcontext
+from decimal import Context, Decimal, localcontext
 import math
+import os
+
+try:
+    import mpmath
+except ImportError:  # mpmath is optional; fall back to the decimal module
+    mpmath = None
+
+try:
+    from gmpy2 import mpz
+except ImportError:  # gmpy2 is optional; binary splitting then uses Python ints
+    mpz = int
+
+
+# Largest precision served by the float64 fast path
+FLOAT64_MAX_PRECISION = 15
+
+# Term ranges at most this long are summed directly by _binary_split
+BINARY_SPLIT_LEAF = 16
+
+# Precision from which BBPBase64(parallel=True) sums the two series in
+# separate processes. Running them side by side saves at most the time of
+# the smaller base -1024 split, which must beat starting a process pool:
+# about 0.01 s with fork but 0.2 s or more with spawn (macOS, Windows).
+# With Python ints that split takes 0.3 s at 50000 digits and 0.7 s at
+# 100000; with gmpy2 it is 5-10x cheaper (0.2 s at 200000 digits, 0.56 s
+# at 500000), while a spawn pool importing gmpy2 and mpmath takes 0.2 s.
+PARALLEL_MIN_PRECISION = 100000 if mpz is int else 500000
+
+
+def _int_to_decimal(n):
+    """
+    Exact Decimal of an integer (int or gmpy2 mpz)
+
+    GMP renders decimal strings in subquadratic time, which is much faster
+    than Decimal's own conversion from a large int.
+    """
+    if mpz is int:
+        return Decimal(n)
+    return Decimal(str(n))
+
+
+def _bbp64_f64(num_terms):
+    """
+    Both series in float64, for precisions a double can represent
+
+    The base -64 terms drop below double resolution after about ten terms,
+    so the loop stops as soon as the denominator makes them negligible.
+    Each sum carries a Neumaier compensation term for the rounding lost to
+    the alternating signs.
+    """
+    sum1 = 0.0
+    comp1 = 0.0
+    sum2 = 0.0
+    comp2 = 0.0
+    sign = 1.0
+    denom1 = 1.0
+    denom2 = 1.0
+    for n in range(num_terms):
+        a = 4.0 * n + 1.0
+        term1 = sign * (8.0 / a + 4.0 / (a + 1.0) + 1.0 / (a + 2.0)) / denom1
+        term2 = sign * (32.0 / a + 8.0 / (a + 1.0) + 1.0 / (a + 2.0)) / denom2
+
+        total = sum1 + term1
+        if abs(sum1) >= abs(term1):
+            comp1 += (sum1 - total) + term1
+        else:
+            comp1 += (term1 - total) + sum1
+        sum1 = total
+
+        total = sum2 + term2
+        if abs(sum2) >= abs(term2):
+            comp2 += (sum2 - total) + term2
+        else:
+            comp2 += (term2 - total) + sum2
+        sum2 = total
+
+        sign = -sign
+        denom1 *= 64.0
+        denom2 *= 1024.0
+        if denom1 > 1e20:
+            break
+    return 4.0 * ((sum1 + comp1) / 16.0 + (sum2 + comp2) / 256.0)
+
 
 class BBPBase64:
     """
@@ -26,15 +109,61 @@ class BBPBase64:
           + (1/256) Σ[n=0 to ∞] (-1)^n / 1024^n * (32/(4n+1) + 8/(4n+2) + 1/(4n+3))
     """
 
-    def __init__(self, precision=100):
+    def __init__(self, precision=100, parallel=False):
         """
         Initialize the BBP Base-64 calculator
 
         Args:
             precision (int): Decimal precision for calculations (default: 100)
+            parallel (bool): Split the two series in worker processes from
+                PARALLEL_MIN_PRECISION on (default: False). Under the spawn
+                start method the calling script needs an
+                ``if __name__ == "__main__":`` guard.
         """
         self.precision = precision
-        getcontext().prec = precision
+        self.parallel = parallel
+        self._rationals = {}
+        self._series_lengths = {}
+        self._fractions = {}
+        self._pi_cache = {}
+        self._sum2_cache = {}
+
+    @property
+    def precision(self):
+        """int: Decimal precision for calculations"""
+        return self._precision
+
+    @precision.setter
+    def precision(self, precision):
+        self._precision = precision
+        # Working bits for the binary arithmetic: log2(10) ≈ 3.33 bits per
+        # digit plus guard bits, shared by mpmath and the fraction truncation
+        self._bits = int(precision * 3.33) + 64
+        self._ctx = Context(prec=precision)
+        self._pi_ref_cache = None
+
+    @property
+    def _pi_ref(self):
+        """
+        π to precision + 5 digits and its string form, for compare_with_pi
+
+        Computed on first use with mpmath when available, otherwise with the
+        independent Machin formula in fixed-point integers (O(N·P), a small
+        multiple of calculate_pi), and cached until the precision changes.
+        """
+        if self._pi_ref_cache is None:
+            digits = self.precision + 5
+            if mpmath is not None:
+                with mpmath.workdps(digits):
+                    pi_reference = Decimal(mpmath.nstr(mpmath.pi, digits))
+            else:
+                # Each arctangent takes as many terms as its log10(1 + 4m²)
+                # digits per term need to reach 10^-scale_digits
+                scale_digits = digits + 10
+                pi_fixed = self._machin_fixed(scale_digits)
+                pi_reference = Decimal(pi_fixed).scaleb(-scale_digits, Context(prec=digits))
+            self._pi_ref_cache = (pi_reference, str(pi_reference))
+        return self._pi_ref_cache
 
     def calculate_pi(self, num_terms=100):
         """
@@ -46,95 +175,301 @@ class BBPBase64:
         Returns:
             Decimal: Approximation of π
         """
-        # First sum: base -64 part
-        sum1 = Decimal(0)
-        for n in range(num_terms):
-            sign = Decimal(-1) ** n
-            denom = Decimal(64) ** n
-            term1 = Decimal(8) / (4 * n + 1)
-            term2 = Decimal(4) / (4 * n + 2)
-            term3 = Decimal(1) / (4 * n + 3)
-            coeff = term1 + term2 + term3
-            term = sign * coeff / denom
-            sum1 += term
-            if abs(term) < Decimal(10) ** (-self.precision + 10):
-                break
-        sum1 /= 16
-
-        # Second sum: base -1024 part
-        sum2 = Decimal(0)
-        for n in range(num_terms):
-            sign = Decimal(-1) ** n
-            denom = Decimal(1024) ** n
-            term1 = Decimal(32) / (4 * n + 1)
-            term2 = Decimal(8) / (4 * n + 2)
-            term3 = Decimal(1) / (4 * n + 3)
-            coeff = term1 + term2 + term3
-            term = sign * coeff / denom
-            sum2 += term
-            if abs(term) < Decimal(10) ** (-self.precision + 10):
-                break
-        sum2 /= 256
-
-        return Decimal(4) * (sum1 + sum2)
+        if self.precision <= FLOAT64_MAX_PRECISION:
+            return self._ctx.create_decimal(repr(_bbp64_f64(num_terms)))
+
+        with localcontext(self._ctx):
+            # Requests that differ only in unused terms share one cached result
+            key = (self.precision,
+                   self._terms_needed(64, (8, 4, 1), num_terms),
+                   self._terms_needed(1024, (32, 8, 1), num_terms))
+            if key not in self._pi_cache:
+                if mpmath is not None:
+                    self._pi_cache[key] = self._calculate_pi_mpmath(num_terms)
+                else:
+                    self._pi_cache[key] = self._calculate_pi_decimal(num_terms)
+            return self._pi_cache[key]
+
+    def _calculate_pi_decimal(self, num_terms):
+        t, q = self._pi_fraction(num_terms)
+        return self._ctx.divide(_int_to_decimal(t), _int_to_decimal(q))
+
+    def _calculate_pi_mpmath(self, num_terms):
+        """
+        Evaluate π with mpmath's binary floats (GMP/MPFR backed)
 
-    def calculate_with_convergence_info(self, max_terms=200):
+        Same fraction as the decimal path; the result is converted back
+        to Decimal only at the end so the public API is unchanged.
         """
-        Calculate π and show convergence information
+        with mpmath.workprec(self._bits):
+            t, q = self._pi_fraction(num_terms)
+            return Decimal(mpmath.nstr(mpmath.mpf(t) / q, self.precision))
+
+    def _pi_fraction(self, num_terms):
+        """
+        π as a single integer fraction T / Q
+
+        The 1/16 and 1/256 prefactors and the outer factor 4 are folded in
+        exactly: π = 4 (T1/(16 Q1) + T2/(256 Q2)) = (16 T1 Q2 + T2 Q1) / (64 Q1 Q2),
+        leaving one high-precision division for the whole formula.
+        """
+        (t1, q1), (t2, q2) = self._series_fractions(num_terms)
+        return self._truncate_fraction((t1 * q2 << 4) + t2 * q1, q1 * q2 << 6)
+
+    def _terms_needed(self, base, coeffs, num_terms):
+        """
+        Number of terms to sum, at most num_terms and never negative
+
+        Uses the bound |term_n| <= (k1+k2+k3) / ((4n+1) * base^n) and stops
+        at the first term below 10^(10-precision). The uncapped length is
+        found once per precision and series, then reused.
+        """
+        key = (self.precision, base, coeffs)
+        if key not in self._series_lengths:
+            log_coeffs = math.log10(sum(coeffs))
+            log_base = math.log10(base)
+            cutoff = 10 - self.precision
+            n = 0
+            while log_coeffs - math.log10(4 * n + 1) - n * log_base >= cutoff:
+                n += 1
+            self._series_lengths[key] = n + 1
+        return max(0, min(num_terms, self._series_lengths[key]))
+
+    def _series_rationals(self, coeffs, count):
+        """
+        Signed integer numerators and denominators of the first count terms
+
+        Each term's k1/(4n+1) + k2/(4n+2) + k3/(4n+3) is put over the common
+        denominator (4n+1)(4n+2)(4n+3), with (-1)^n folded into the numerator.
+        The exact values are cached per coefficient triple and extended on
+        demand, so every method summing the same series shares one table.
+
+        Both are evaluated as polynomials in n, a whole block at a time:
+        (4n+1)(4n+2)(4n+3) = 64n³ + 96n² + 44n + 6 and the numerator
+        16(k1+k2+k3)n² + (20k1+16k2+12k3)n + (6k1+3k2+2k3).
+        """
+        nums, dens = self._rationals.setdefault(coeffs, ([], []))
+        start = len(nums)
+        if count > start:
+            k1, k2, k3 = coeffs
+            c2 = 16 * (k1 + k2 + k3)
+            c1 = 20 * k1 + 16 * k2 + 12 * k3
+            c0 = 6 * k1 + 3 * k2 + 2 * k3
+            block = range(start, count)
+            new_nums = [(c2 * n + c1) * n + c0 for n in block]
+            odd = 1 - start % 2
+            new_nums[odd::2] = [-num for num in new_nums[odd::2]]
+            nums.extend(new_nums)
+            dens.extend([((64 * n + 96) * n + 44) * n + 6 for n in block])
+        return nums[:count], dens[:count]
+
+    @staticmethod
+    def _binary_split(nums, dens, shift, a, b):
+        """
+        Binary splitting of Σ[n=a to b-1] nums[n] / (dens[n] * 2^(shift*(n-a)))
+
+        Returns (T, Q, S) with the partial sum equal to T / (Q * 2^(S-shift)).
+        Sub-sums are merged into one exact fraction, so the work is a few
+        large integer multiplications instead of one bignum division per term.
+        """
+        if b - a <= BINARY_SPLIT_LEAF:
+            # Short ranges are folded left to right, one term at a time;
+            # starting from mpz keeps all larger products in GMP when available
+            t, q, s = mpz(nums[a]), mpz(dens[a]), shift
+            for n in range(a + 1, b):
+                t = (t * dens[n] << shift) + nums[n] * q
+                q *= dens[n]
+                s += shift
+            return t, q, s
+        mid = (a + b) // 2
+        t_left, q_left, s_left = BBPBase64._binary_split(nums, dens, shift, a, mid)
+        t_right, q_right, s_right = BBPBase64._binary_split(nums, dens, shift, mid, b)
+        return ((t_left * q_right << s_right) + t_right * q_left,
+                q_left * q_right, s_left + s_right)
+
+    def _series_fraction(self, base, coeffs, num_terms):
+        """
+        Σ (-1)^n / base^n * (k1/(4n+1) + k2/(4n+2) + k3/(4n+3)) as integers T / Q
+
+        base must be a power of two so the base powers become bit shifts.
+        The exact fraction is much wider than the working precision, so it
+        is truncated before it is handed to the floating-point type.
+        Results are cached, so calculate_pi and _compute_sum2 share the
+        base -1024 split.
+        """
+        key = self._fraction_key(base, coeffs, num_terms)
+        if key not in self._fractions:
+            count = key[-1]
+            if count == 0:
+                self._fractions[key] = (0, 1)
+            else:
+                nums, dens = self._series_rationals(coeffs, count)
+                shift = base.bit_length() - 1
+                t, q, s = self._binary_split(nums, dens, shift, 0, count)
+                self._fractions[key] = self._truncate_fraction(t, q << (s - shift))
+        return self._fractions[key]
+
+    def _fraction_key(self, base, coeffs, num_terms):
+        return (self.precision, base, coeffs,
+                self._terms_needed(base, coeffs, num_terms))
+
+    def _truncate_fraction(self, t, q):
+        """Drop low bits of T / Q beyond the working precision plus guard bits"""
+        excess = q.bit_length() - self._bits
+        if excess > 0:
+            t >>= excess
+            q >>= excess
+        return t, q
+
+    def _series_fractions(self, num_terms):
+        """
+        Fractions (T, Q) of the base -64 and base -1024 series
+
+        With parallel enabled, from PARALLEL_MIN_PRECISION on and with more
+        than one CPU, the two independent series are split in separate worker
+        processes; the integer arithmetic holds the GIL, so threads would not
+        overlap.
+        """
+        series = ((64, (8, 4, 1)), (1024, (32, 8, 1)))
+        if (not self.parallel or self.precision < PARALLEL_MIN_PRECISION
+                or (os.cpu_count() or 1) < 2):
+            return [self._series_fraction(base, coeffs, num_terms)
+                    for base, coeffs in series]
+
+        keys = [self._fraction_key(base, coeffs, num_terms) for base, coeffs in series]
+        if any(key not in self._fractions for key in keys):
+            # Imported here: concurrent.futures is costly to load and only
+            # the opt-in parallel path needs it
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=len(series)) as pool:
+                futures = [pool.submit(_series_fraction_job, self.precision,
+                                       base, coeffs, num_terms)
+                           for base, coeffs in series]
+                for key, future in zip(keys, futures):
+                    self._fractions[key] = future.result()
+        return [self._fractions[key] for key in keys]
+
+    def _decimal_series(self, base, coeffs, num_terms):
+        t, q = self._series_fraction(base, coeffs, num_terms)
+        return self._ctx.divide(_int_to_decimal(t), _int_to_decimal(q))
+
+    def _mpmath_series(self, base, coeffs, num_terms):
+        t, q = self._series_fraction(base, coeffs, num_terms)
+        return mpmath.mpf(t) / q
+
+    def calculate_pi_machin(self, num_terms=100):
+        """
+        Calculate π with Machin's formula π = 16·arctan(1/5) - 4·arctan(1/239)
+
+        Both arctangents use the rational expansion of Abrarov and Quine,
+        which gains roughly log10(1 + 4m²) digits per term for arctan(1/m).
+        The terms are carried as fixed-point integers scaled by 10^digits,
+        so each term costs only multiplications and divisions by small
+        integers, O(precision) work per term.
 
         Args:
-            max_terms (int): Maximum number of terms to use
+            num_terms (int): Maximum number of terms per arctangent (default: 100)
 
         Returns:
-            tuple: (final_result, convergence_info)
+            Decimal: Approximation of π
         """
-        convergence_info = []
-        pi_sum = Decimal(0)
+        scale_digits = self.precision + 10
+        pi_fixed = self._machin_fixed(scale_digits, num_terms)
+        return Decimal(pi_fixed).scaleb(-scale_digits, self._ctx)
 
-        checkpoints = [10, 25, 50, 75, 100, 150, 200]
-        checkpoint_idx = 0
+    def _machin_fixed(self, scale_digits, num_terms=None):
+        """π · 10^scale_digits as an integer, with Machin's formula"""
+        return (16 * self._arctan_inv_fixed(5, scale_digits, num_terms)
+                - 4 * self._arctan_inv_fixed(239, scale_digits, num_terms))
 
-        # Since there are two sums, we'll approximate convergence by terms in the main sum
-        sum1 = Decimal(0)
-        sum2 = self._compute_sum2(max_terms)  # Compute full sum2 as it converges fast
+    @staticmethod
+    def _arctan_inv_fixed(m, scale_digits, num_terms=None):
+        """
+        arctan(1/m) · 10^scale_digits as an integer
 
-        for n in range(max_terms):
-            sign = Decimal(-1) ** n
-            denom = Decimal(64) ** n
-            term1 = Decimal(8) / (4 * n + 1)
-            term2 = Decimal(4) / (4 * n + 2)
-            term3 = Decimal(1) / (4 * n + 3)
-            coeff = term1 + term2 + term3
-            term = sign * coeff / denom
-            sum1 += term
+        arctan(1/m) = 2 Σ[n=1 to ∞] 1/(2n-1) * g_n / (g_n² + h_n²)
 
-            current_sum1 = sum1 / 16
-            current_pi = Decimal(4) * (current_sum1 + sum2 / 256)
+        with g_1 = 2m, h_1 = 1 and
+        g_n = g_{n-1} (1 - 4m²) + 4m h_{n-1},  h_n = h_{n-1} (1 - 4m²) - 4m g_{n-1}
 
-            # Record convergence at checkpoints
-            if checkpoint_idx < len(checkpoints) and n + 1 == checkpoints[checkpoint_idx]:
-                convergence_info.append((n + 1, current_pi))
-                checkpoint_idx += 1
+        The recurrence is a rotation-scaling, so g_n² + h_n² = (1 + 4m²)^(2n-1)
+        exactly. Dividing g_n and h_n by it gives u_n and v_n, which follow the
+        same recurrence divided by (1 + 4m²)² and shrink by 1 + 4m² per term;
+        they are kept as fixed-point integers. The term count is bounded by
+        the number of terms above 10^-scale_digits, and by num_terms if given.
+        """
+        k = 1 + 4 * m * m
+        step = 1 - 4 * m * m
+        ratio = k * k
+        count = int(scale_digits / math.log10(k)) + 2
+        if num_terms is not None:
+            count = min(count, num_terms)
+        one = 10 ** scale_digits
+        u = 2 * m * one // k
+        v = one // k
+        total = 0
+        for n in range(1, count + 1):
+            total += 2 * u // (2 * n - 1)
+            u, v = (u * step + 4 * m * v) // ratio, (v * step - 4 * m * u) // ratio
+        return total
 
-            # Early termination
-            if abs(term) < Decimal(10) ** (-self.precision + 10):
-                break
+    def calculate_with_convergence_info(self, max_terms=200):
+        """
+        Calculate π and show convergence information
 
-        return current_pi, convergence_info
+        Args:
+            max_terms (int): Maximum number of terms to use
+
+        Returns:
+            tuple: (final_result, convergence_info)
+        """
+        with localcontext(self._ctx):
+            convergence_info = []
+
+            checkpoints = [10, 25, 50, 75, 100, 150, 200]
+            checkpoint_idx = 0
+
+            # Since there are two sums, we'll approximate convergence by terms in the main sum
+            sum2 = self._compute_sum2(max_terms)  # Compute full sum2 as it converges fast
+            sum2_over_256 = sum2 / 256
+
+            # sum1 is kept as a fixed-point integer scaled by 2^bits: as
+            # 64^n = 2^(6n), each term is a shift and one division by a small
+            # integer. The loop maintains only sum1; partial values of π are
+            # built at the checkpoints and once at the end, with the 1/16
+            # prefactor folded into the scale.
+            bits = self._bits
+            scale = Decimal(1 << (bits + 4))
+            fixed_sum1 = 0
+
+            # The cut-off is found up front, so the loop does no per-term test
+            count = self._terms_needed(64, (8, 4, 1), max_terms)
+            nums, dens = self._series_rationals((8, 4, 1), count)
+            for n in range(count):
+                fixed_sum1 += (nums[n] << (bits - 6 * n)) // dens[n]
+
+                # Record convergence at checkpoints
+                if checkpoint_idx < len(checkpoints) and n + 1 == checkpoints[checkpoint_idx]:
+                    current_pi = Decimal(4) * (Decimal(fixed_sum1) / scale + sum2_over_256)
+                    convergence_info.append((n + 1, current_pi))
+                    checkpoint_idx += 1
+
+            current_pi = Decimal(4) * (Decimal(fixed_sum1) / scale + sum2_over_256)
+            return current_pi, convergence_info
 
     def _compute_sum2(self, max_terms):
-        sum2 = Decimal(0)
-        for n in range(max_terms):
-            sign = Decimal(-1) ** n
-            denom = Decimal(1024) ** n
-            term1 = Decimal(32) / (4 * n + 1)
-            term2 = Decimal(8) / (4 * n + 2)
-            term3 = Decimal(1) / (4 * n + 3)
-            coeff = term1 + term2 + term3
-            term = sign * coeff / denom
-            sum2 += term
-            if abs(term) < Decimal(10) ** (-self.precision + 10):
-                break
+        key = (self.precision, self._terms_needed(1024, (32, 8, 1), max_terms))
+        if key in self._sum2_cache:
+            return self._sum2_cache[key]
+
+        if mpmath is not None:
+            with mpmath.workprec(self._bits):
+                series = self._mpmath_series(1024, (32, 8, 1), max_terms)
+                sum2 = Decimal(mpmath.nstr(series, self.precision))
+        else:
+            sum2 = self._decimal_series(1024, (32, 8, 1), max_terms)
+        self._sum2_cache[key] = sum2
         return sum2
 
     def compare_with_pi(self, result=None, num_terms=100):
@@ -148,35 +483,29 @@ class BBPBase64:
         Returns:
             dict: Comparison information
         """
-        if result is None:
-            result = self.calculate_pi(num_terms)
-
-        # High-precision π for comparison
-        pi_reference = Decimal("3.1415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679")
-
-        # Count matching digits
-        result_str = str(result)
-        pi_str = str(pi_reference)
-
-        matches = 0
-        for i in range(min(len(result_str), len(pi_str))):
-            if result_str[i] == pi_str[i]:
-                matches += 1
-            else:
-                break
-
-        error = abs(result - pi_reference)
-        relative_error = error / pi_reference
-
-        return {
-            'result': result,
-            'reference': pi_reference,
-            'matching_digits': matches - 1,  # Subtract 1 for the integer part '3'
-            'absolute_error': error,
-            'relative_error': relative_error,
-            'result_str': result_str[:30],
-            'reference_str': pi_str[:30]
-        }
+        with localcontext(self._ctx):
+            if result is None:
+                result = self.calculate_pi(num_terms)
+
+            # High-precision π for comparison
+            pi_reference, pi_str = self._pi_ref
+
+            # Count matching digits (the common prefix scan runs in C)
+            result_str = str(result)
+            matches = len(os.path.commonprefix([result_str, pi_str]))
+
+            error = abs(result - pi_reference)
+            relative_error = error / pi_reference
+
+            return {
+                'result': result,
+                'reference': pi_reference,
+                'matching_digits': matches - 1,  # Subtract 1 for the integer part '3'
+                'absolute_error': error,
+                'relative_error': relative_error,
+                'result_str': result_str[:30],
+                'reference_str': pi_str[:30]
+            }
 
     def extract_base64_digits(self, start_digit=0, num_digits=10):
         """
@@ -192,21 +521,27 @@ class BBPBase64:
         Returns:
             list: Base-64 digits
         """
-        # Calculate π with high precision
-        pi_val = self.calculate_pi(num_terms=200)
+        with localcontext(self._ctx):
+            # Calculate π with high precision
+            pi_val = self.calculate_pi(num_terms=200)
+
+            # Convert to base 64 (simplified approach)
+            # Remove integer part
+            fractional_part = pi_val - int(pi_val)
+
+            # Scale the fraction by 64^total exactly; since 64 = 2^6, each
+            # base-64 digit is then a 6-bit slice of one integer
+            total = num_digits + start_digit
+            numerator, denominator = fractional_part.as_integer_ratio()
+            scaled = (numerator << (6 * total)) // denominator
 
-        # Convert to base 64 (simplified approach)
-        # Remove integer part
-        fractional_part = pi_val - int(pi_val)
+            return [(scaled >> (6 * (total - 1 - i))) & 63
+                    for i in range(start_digit, total)]
 
-        digits = []
-        for i in range(num_digits + start_digit):
-            fractional_part *= 64
-            digit = int(fractional_part)
-            digits.append(digit)
-            fractional_part -= digit
 
-        return digits[start_digit:]
+def _series_fraction_job(precision, base, coeffs, num_terms):
+    """Worker-process entry point for BBPBase64._series_fractions"""
+    return BBPBase64(precision)._series_fraction(base, coeffs, num_terms)
 
 
 def demo():